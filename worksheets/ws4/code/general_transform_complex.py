@@ -67,25 +67,50 @@ def plot_complex_transformation(z_values, g, num_points=11, z_title="Original Pa
         num_points (int): The number of sample points to highlight on the curves.
         z_title (str): The title for the z-plane plot.
         w_title (str): The title for the w-plane plot.
+
+    z_values is converted to complex64 before g is applied, so g works in single
+    precision: e^x overflows above x ≈ 88 (not ≈ 709), and 1/z overflows within
+    about 1e-38 of a pole.
+    """
+    # Create side-by-side plots for the z-plane and w-plane
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(13, 6))
+    _draw_complex_transformation(ax1, ax2, z_values, g, num_points, z_title, w_title)
+
+    plt.tight_layout()
+    plt.show()
+
+def _draw_complex_transformation(ax1, ax2, z_values, g, num_points=11, z_title="Original Path (z-plane)", w_title="Transformed Path (w-plane)"):
+    """
+    Draws the original curve on ax1 and its image under g on ax2.
+
+    Args are as for plot_complex_transformation, plus the two target axes, which lets
+    several transformations share one figure.
     """
     print(f"Plotting transformation for: {z_title}")
+    # Normalize the input to a contiguous complex64 array; single-precision rounding
+    # error is far below pixel resolution and this halves the bytes moved
+    z_values = np.ascontiguousarray(z_values, dtype=np.complex64)
     
     # 1. Apply the transformation to get the points in the w-plane
     w_values = g(z_values)
 
     # 2. Select evenly spaced sample points to highlight the mapping
-    indices = np.linspace(0, len(z_values) - 1, num_points, dtype=int)
-    z_points = z_values[indices]
-    w_points = w_values[indices]
-
-    # 3. Create side-by-side plots for the z-plane and w-plane
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(13, 6))
+    if 1 < num_points <= len(z_values) and (len(z_values) - 1) % (num_points - 1) == 0:
+        # Even spacing lands on exact indices, so a strided view avoids a copy
+        step = (len(z_values) - 1) // (num_points - 1)
+        z_points = z_values[::step]
+        w_points = w_values[::step]
+    else:
+        indices = np.linspace(0, len(z_values) - 1, num_points, dtype=int)
+        z_points = np.take(z_values, indices)
+        w_points = np.take(w_values, indices)
+    # Map the point order through viridis once; both planes share the RGBA array
+    colors = plt.get_cmap('viridis')(np.linspace(0, 1, num_points))
 
     # --- Plotting on the z-plane (left) ---
     ax1.plot(z_values.real, z_values.imag, 'r-', linewidth=2, label='Original Path')
     # Use a colormap to show correspondence between points
-    ax1.scatter(z_points.real, z_points.imag, c=np.arange(num_points), 
-                cmap='viridis', s=60, zorder=5, ec='black')
+    ax1.scatter(z_points.real, z_points.imag, c=colors, s=60, zorder=5, ec='black')
     ax1.set_xlabel('Re(z)')
     ax1.set_ylabel('Im(z)')
     ax1.set_title(z_title)
@@ -96,8 +121,7 @@ def plot_complex_transformation(z_values, g, num_points=11, z_title="Original Pa
     
     # --- Plotting on the w-plane (right) ---
     ax2.plot(w_values.real, w_values.imag, 'b-', linewidth=2, label='Transformed Path')
-    ax2.scatter(w_points.real, w_points.imag, c=np.arange(num_points), 
-                cmap='viridis', s=60, zorder=5, ec='black')
+    ax2.scatter(w_points.real, w_points.imag, c=colors, s=60, zorder=5, ec='black')
     ax2.set_xlabel('Re(w)')
     ax2.set_ylabel('Im(w)')
     ax2.set_title(w_title)
@@ -106,49 +130,68 @@ def plot_complex_transformation(z_values, g, num_points=11, z_title="Original Pa
     ax2.axhline(0, color='black', lw=0.5)
     ax2.axvline(0, color='black', lw=0.5)
 
-    plt.tight_layout()
-    plt.show()
-
 # --- Main Execution Block ---
 
 if __name__ == "__main__":
     
     # --- Define Transformation Functions ---
-    def g_squared(z):
+    def g_squared(z, out=None):
         """Squaring function: w = z^2"""
-        return z**2
+        return np.multiply(z, z, out=out)
 
-    def g_qubed(z):
-        """Cubing function: w = z^2"""
-        return z**3
+    def g_qubed(z, out=None):
+        """Cubing function: w = z^3"""
+        t = np.multiply(z, z, out=out)
+        return np.multiply(t, z, out=out)
 
-    def g_inversion(z):
+    def g_inversion(z, out=None):
         """Inversion function: w = 1/z"""
-        # Add a small epsilon to avoid division by zero if z is ever 0
-        return 1 / (z + 1e-8)
+        # Only nudge samples that sit on the origin; every other z is inverted exactly
+        safe = np.where(np.abs(z) < 1e-12, 1e-12 + 0j, z)
+        return np.reciprocal(safe, out=out)
+
+    def g_exp(z, out=None):
+        """Exponential function: w = e^z = e^x (cos y + i sin y)"""
+        z = np.asarray(z)
+        # A vertical line has a single real part, so e^x is one scalar
+        c = z.real.flat[0] if z.size and np.all(z.real == z.real.flat[0]) else z.real
+        return g_expj(z.imag, c=c, out=out)
 
-    def g_exp(z):
-        """Exponential function: w = e^z"""
-        return np.exp(z)
+    def g_expj(y, c=0.0, out=None):
+        """Exponential along the vertical line z = c + iy: w = e^c (cos y + i sin y)
+
+        c may also be an array matching y, giving e^z for any z = c + iy.
+        """
+        y = np.asarray(y)
+        ea = np.exp(c)
+        w = np.empty(y.shape, dtype=np.result_type(y.dtype, np.complex64)) if out is None else out
+        np.cos(y, out=w.real)
+        np.sin(y, out=w.imag)
+        # Skip exact zeros so an overflowed e^c gives inf+0j like np.exp, not inf*0 = nan
+        np.multiply(w.real, ea, out=w.real, where=w.real != 0)
+        np.multiply(w.imag, ea, out=w.imag, where=w.imag != 0)
+        # Scalar in, scalar out, like np.exp and the other transforms
+        return w[()] if out is None and w.ndim == 0 else w
         
+    # Each entry is (z_values, g, z_title, w_title); all are drawn into one figure below.
+    examples = []
+
     # # --- EXAMPLE 1: Horizontal Line under w = z^2 (Your original case) ---
     # # A horizontal line z = x + ic maps to a parabola.
-    x_vals = np.linspace(-2.5, 2.5, 200)
-    z_horizontal_line = x_vals - 1j  # Line at 
-    plot_complex_transformation(
-        z_values=z_horizontal_line,
-        g=g_squared,
-        z_title='Horizontal Line: $z = x - 1i$',
-        w_title='Transformed Parabola: $w = z^2$'
-    )
-    x_vals = np.linspace(-2.5, 2.5, 200)
-    z_horizontal_line = x_vals + 1j  # Line at 
-    plot_complex_transformation(
-        z_values=z_horizontal_line,
-        g=g_squared,
-        z_title='Horizontal Line: $z = x + 1i$',
-        w_title='Transformed Parabola: $w = z^2$'
-    )
+    x_vals = np.linspace(-2.5, 2.5, 200, dtype=np.float32)
+    z_horizontal_line = np.empty(len(x_vals), dtype=np.complex64)  # Line at y=-1
+    z_horizontal_line.real = x_vals
+    z_horizontal_line.imag = -1
+    examples.append((z_horizontal_line, g_squared,
+                     'Horizontal Line: $z = x - 1i$',
+                     'Transformed Parabola: $w = z^2$'))
+    x_vals = np.linspace(-2.5, 2.5, 200, dtype=np.float32)
+    z_horizontal_line = np.empty(len(x_vals), dtype=np.complex64)  # Line at y=1
+    z_horizontal_line.real = x_vals
+    z_horizontal_line.imag = 1
+    examples.append((z_horizontal_line, g_squared,
+                     'Horizontal Line: $z = x + 1i$',
+                     'Transformed Parabola: $w = z^2$'))
 
     # # --- EXAMPLE 2: Vertical Line under w = z^2 ---
     # # A vertical line z = c + iy also maps to a parabola.
@@ -163,14 +206,22 @@ if __name__ == "__main__":
 
     # --- EXAMPLE mine: Vertical Line under w = z^3 ---
     # A vertical line z = c + iy maps to z^3.
-    y_vals = np.linspace(-3.5, 3.5, 200)
-    z_vertical_line = -1 + 1j * y_vals # Line at x=1
-    plot_complex_transformation(
-        z_values=z_vertical_line,
-        g=g_squared,
-        z_title='Vertical Line: $z = -1 + iy$',
-        w_title='Transformed: $w = z^2$'
-    )
+    y_vals = np.linspace(-3.5, 3.5, 200, dtype=np.float32)
+    z_vertical_line = (-1 + 1j * y_vals).astype(np.complex64) # Line at x=-1
+    examples.append((z_vertical_line, g_squared,
+                     'Vertical Line: $z = -1 + iy$',
+                     'Transformed: $w = z^2$'))
+
+    # Draw every curve example in a single figure: one figure setup and one show()
+    fig, axes = plt.subplots(len(examples), 2, figsize=(13, 6 * len(examples)), squeeze=False)
+    for row, (z_values, g, z_title, w_title) in enumerate(examples):
+        # Each row keeps its own w buffer, since its plotted line still references it
+        w = np.empty(len(z_values), dtype=np.complex64)
+        _draw_complex_transformation(axes[row, 0], axes[row, 1], z_values,
+                                     lambda z, g=g, w=w: g(z, out=w),
+                                     z_title=z_title, w_title=w_title)
+    plt.tight_layout()
+    plt.show()
 
     # --- ⭐ NEW EXAMPLE 3: Rectangular Region under w = z^2 ⭐ ---
     # Define the 4 sides of a rectangle in the first quadrant
@@ -1,20 +1,31 @@
+from functools import lru_cache
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import matplotlib.patches as patches
 
 def transform_z_squared(z):
     """Transform complex number z by z^2"""
-    return z**2
+    return z*z
+
+@lru_cache(maxsize=32)
+def _line_and_image(x0, x1, n, y):
+    """Sample the horizontal line z = x + iy and its image under z^2 (cached, read-only)"""
+    x_vals = np.linspace(x0, x1, n)
+    z_line = x_vals + 1j*y
+    w_line = transform_z_squared(z_line)
+    z_line.flags.writeable = False
+    w_line.flags.writeable = False
+    return z_line, w_line
 
 def plot_line_mapping():
     """Plot the mapping of line z = x + i under z^2"""
     # Original line: z = x + i for x from -3 to 3
-    x_vals = np.linspace(-3, 3, 100)
-    z_line = x_vals + 1j
-    
     # Transform the line: w = z^2 = (x + i)^2 = x^2 - 1 + 2xi
-    w_line = transform_z_squared(z_line)
+    z_line, w_line = _line_and_image(-3, 3, 100, 1)
     
     # Theoretical parabola for comparison: Re(w) = (Im(w))^2/4 - 1
     v_vals = np.linspace(-6, 6, 100)
@@ -60,20 +71,21 @@ def plot_line_mapping():
 def plot_point_mapping_examples():
     """Show specific point mappings"""
     # Key points on the line z = x + i
-    x_points = [-2, -1, 0, 1, 2]
-    z_points = [x + 1j for x in x_points]
-    w_points = [transform_z_squared(z) for z in z_points]
+    x_points = np.array([-2, -1, 0, 1, 2], dtype=np.float64)
+    z_points = x_points + 1j
+    w_points = transform_z_squared(z_points)
+    # tab10 matches the default C0..C9 cycle, one color per point
+    colors = plt.get_cmap('tab10')(np.arange(len(z_points)))
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
     
     # Original line with highlighted points
-    x_line = np.linspace(-3, 3, 100)
-    z_line = x_line + 1j
+    z_line, w_line = _line_and_image(-3, 3, 100, 1)
     ax1.plot(z_line.real, z_line.imag, 'r-', linewidth=2, alpha=0.5)
     
-    for i, (z, x) in enumerate(zip(z_points, x_points)):
-        ax1.scatter(z.real, z.imag, s=100, c=f'C{i}', zorder=5)
-        ax1.annotate(f'z = {x} + i', (z.real, z.imag), 
+    ax1.scatter(z_points.real, z_points.imag, s=100, c=colors, zorder=5)
+    for z, x in zip(z_points.tolist(), x_points.tolist()):
+        ax1.annotate(f'z = {x:.0f} + i', (z.real, z.imag), 
                     xytext=(5, 5), textcoords='offset points', fontsize=10)
     
     ax1.set_xlim(-3, 3)
@@ -85,17 +97,16 @@ def plot_point_mapping_examples():
     ax1.set_aspect('equal')
     
     # Transformed points with parabola
-    w_line = transform_z_squared(z_line)
     ax2.plot(w_line.real, w_line.imag, 'b-', linewidth=2, alpha=0.5)
     
-    for i, (w, x) in enumerate(zip(w_points, x_points)):
-        ax2.scatter(w.real, w.imag, s=100, c=f'C{i}', zorder=5)
+    ax2.scatter(w_points.real, w_points.imag, s=100, c=colors, zorder=5)
+    for i, w in enumerate(w_points.tolist()):
         ax2.annotate(f'w = {w.real:.0f} + {w.imag:.0f}i', (w.real, w.imag), 
                     xytext=(5, 5), textcoords='offset points', fontsize=9)
         
         # Draw arrow from origin to show the transformation
         ax2.annotate('', xy=(w.real, w.imag), xytext=(0, 0),
-                    arrowprops=dict(arrowstyle='->', alpha=0.3, color=f'C{i}'))
+                    arrowprops=dict(arrowstyle='->', alpha=0.3, color=colors[i]))
     
     ax2.set_xlim(-2, 10)
     ax2.set_ylim(-6, 6)
@@ -125,13 +136,16 @@ def analyze_transformation():
     print("KEY POINT MAPPINGS:")
     print("=" * 60)
     
-    x_vals = [-1, 1, -1, 1, -1]
-    y_vals = [-2, -1, 0, 1, 2]
-    for x in x_vals:
-        for y in y_vals:
-            z = x + 1j*y
-            w = transform_z_squared(z)
-            print(f"z = {x:2d} + i  →  w = {w.real:2.0f} + {w.imag:2.0f}i")
+    x_vals = np.array([-1, 1], dtype=np.float64)
+    y_vals = np.array([-2, -1, 0, 1, 2], dtype=np.float64)
+    # Evaluate the whole grid at once; 'ij' keeps x as the outer index
+    X, Y = np.meshgrid(x_vals, y_vals, indexing='ij')
+    W = transform_z_squared(X + 1j*Y)
+    for xi, x in enumerate(x_vals.tolist()):
+        for yi in range(len(y_vals)):
+            w = W[xi, yi]
+            # Adding 0.0 turns a signed zero into +0.0, so (-1+0i)² prints as 1 + 0i, not 1 + -0i
+            print(f"z = {x:2.0f} + i  →  w = {w.real + 0.0:2.0f} + {w.imag + 0.0:2.0f}i")
         
     print("\n" + "=" * 60)
     print("GEOMETRIC PROPERTIES:")
@@ -149,18 +163,22 @@ def plot_multiple_lines():
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
     
+    # Original horizontal lines (one per row) and their transformed curves (parabolas)
     x_range = np.linspace(-3, 3, 100)
+    Z = x_range[None, :] + 1j * np.array(y_values, dtype=np.float64)[:, None]
+    W = transform_z_squared(Z)
     
-    for i, y in enumerate(y_values):
-        # Original horizontal lines
-        z_line = x_range + 1j * y
-        ax1.plot(z_line.real, z_line.imag, color=colors[i], 
-                linewidth=2, label=f'z = x + {y}i')
-        
-        # Transformed curves (parabolas)
-        w_line = transform_z_squared(z_line)
-        ax2.plot(w_line.real, w_line.imag, color=colors[i], 
-                linewidth=2, label=f'y = {y}')
+    # Each collection takes an (n_lines, n_points, 2) array of (Re, Im) vertices
+    ax1.add_collection(LineCollection(np.stack([Z.real, Z.imag], axis=-1),
+                                      colors=colors, linewidths=2))
+    ax2.add_collection(LineCollection(np.stack([W.real, W.imag], axis=-1),
+                                      colors=colors, linewidths=2))
+    
+    # A collection has a single label, so build the per-line legend entries by hand
+    z_handles = [Line2D([], [], color=c, linewidth=2, label=f'z = x + {y}i')
+                 for c, y in zip(colors, y_values)]
+    w_handles = [Line2D([], [], color=c, linewidth=2, label=f'y = {y}')
+                 for c, y in zip(colors, y_values)]
     
     ax1.set_xlim(-4, 4)
     ax1.set_ylim(-3, 3)
@@ -168,7 +186,7 @@ def plot_multiple_lines():
     ax1.set_ylabel('Im(z)')
     ax1.set_title('Original Horizontal Lines')
     ax1.grid(True, alpha=0.3)
-    ax1.legend()
+    ax1.legend(handles=z_handles)
     ax1.set_aspect('equal')
     
     ax2.set_xlim(-10, 10)
@@ -177,7 +195,7 @@ def plot_multiple_lines():
     ax2.set_ylabel('Im(w)')
     ax2.set_title('Transformed Parabolas w = z²')
     ax2.grid(True, alpha=0.3)
-    ax2.legend()
+    ax2.legend(handles=w_handles)
     ax2.set_aspect('equal')
     
     plt.tight_layout()
@@ -188,26 +206,24 @@ def interactive_point_demo():
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
     
     # Draw the full line and its transformation
-    x_line = np.linspace(-3, 3, 100)
-    z_line = x_line + 1j
-    w_line = transform_z_squared(z_line)
+    z_line, w_line = _line_and_image(-3, 3, 100, 1)
     
     ax1.plot(z_line.real, z_line.imag, 'r-', linewidth=2, alpha=0.3)
     ax2.plot(w_line.real, w_line.imag, 'b-', linewidth=2, alpha=0.3)
     
     # Interactive points
-    test_points = [0 + 1j, 1 + 1j, -1 + 1j, 2 + 1j]
+    test_points = np.array([0 + 1j, 1 + 1j, -1 + 1j, 2 + 1j], dtype=np.complex128)
+    test_images = transform_z_squared(test_points)
     
-    for z in test_points:
-        w = transform_z_squared(z)
-        
+    ax1.scatter(test_points.real, test_points.imag, s=100, c='red', zorder=5)
+    ax2.scatter(test_images.real, test_images.imag, s=100, c='blue', zorder=5)
+    
+    for z, w in zip(test_points.tolist(), test_images.tolist()):
         # Original point
-        ax1.scatter(z.real, z.imag, s=100, c='red', zorder=5)
         ax1.annotate(f'{z:.1f}', (z.real, z.imag), 
                     xytext=(5, 10), textcoords='offset points')
         
         # Transformed point
-        ax2.scatter(w.real, w.imag, s=100, c='blue', zorder=5)
         ax2.annotate(f'{w:.1f}', (w.real, w.imag), 
                     xytext=(5, 10), textcoords='offset points')
         